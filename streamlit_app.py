@@ -1,13 +1,32 @@
+import html
 import os
 import re
+import sqlite3
+import time
+from dataclasses import dataclass
 import streamlit as st
+import numpy as np
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import tomllib as toml  # Python 3.11+ 표준 라이브러리 (C 가속)
+except ImportError:
+    try:
+        import toml
+    except ImportError:  # toml이 없으면 secrets.toml 직접 읽기를 건너뜀
+        toml = None
+
+try:
+    import yt_dlp
+except ImportError:  # yt-dlp가 없으면 YouTube Data API만 사용
+    yt_dlp = None
 
 # Set page configuration
 st.set_page_config(
@@ -16,50 +35,261 @@ st.set_page_config(
     layout="wide"
 )
 
-# 국가 코드와 이름 매핑
-REGION_CODES = {
-    '🇰🇷 대한민국': 'KR',
-    '🇺🇸 미국': 'US',
-    '🇯🇵 일본': 'JP',
-    '🇬🇧 영국': 'GB',
-    '🇨🇦 캐나다': 'CA',
-    '🇦🇺 호주': 'AU',
-    '🇩🇪 독일': 'DE',
-    '🇫🇷 프랑스': 'FR',
-    '🇮🇳 인도': 'IN',
-    '🇧🇷 브라질': 'BR'
-}
+@st.cache_resource
+def _load_env() -> bool:
+    """Load environment variables from .env file once per process."""
+    load_dotenv()
+    return True
+
+_load_env()
+
+# Retry-After 헤더로 기다리는 최대 시간 (초)
+MAX_RETRY_AFTER = 5
+
+class _CappedRetry(Retry):
+    """Retry policy that caps the delay requested by a Retry-After header."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+@st.cache_resource
+def _create_session() -> requests.Session:
+    """Create an HTTP session shared across reruns (keep-alive connection pool)."""
+    session = requests.Session()
+    session.headers['Connection'] = 'keep-alive'
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=_CappedRetry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    ))
+    return session
+
+# YouTube API 호출에 재사용할 HTTP 세션 (스크립트 재실행 간에도 유지)
+_session = _create_session()
+
+# 요청 타임아웃 (연결, 읽기)
+REQUEST_TIMEOUT = (3.05, 10)
+
+# 채널 정보 개별 요청 시 동시 요청 수 (API 할당량 급증 방지)
+MAX_CHANNEL_WORKERS = 8
+
+# 채널 정보 디스크 캐시 (프로세스 재시작 후에도 유지)
+CHANNEL_CACHE_PATH = os.path.join(os.path.dirname(__file__), '.cache', 'channels.sqlite3')
+CHANNEL_CACHE_TTL = 86400
+
+# API 키를 직접 읽을 secrets.toml 경로
+SECRETS_PATH = os.path.join(os.path.dirname(__file__), '.streamlit', 'secrets.toml')
+
+# 동영상 그리드 스타일 (한 줄에 3개)
+VIDEO_GRID_STYLE = """<style>
+.video-grid {display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;}
+.video-thumbnail {width: 100%; border-radius: 0.5rem;}
+.video-title {margin: 0.5rem 0;}
+.video-channel {display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;}
+.channel-thumbnail {width: 30px; height: 30px; border-radius: 50%;}
+.video-card {border-bottom: 1px solid #eee; padding-bottom: 8px; margin-bottom: 8px;}
+.video-card p {margin-bottom: 0.25rem;}
+</style>"""
+
+@dataclass(slots=True)
+class Video:
+    """A popular video with its channel details and display strings."""
+    id: str
+    title: str
+    channel: str
+    channel_id: str
+    thumbnail: str
+    views: int
+    likes: int
+    comments: int
+    subscribers: int
+    published_at: str
+    duration: str
+    channel_thumbnail: str
+    display_views: str = ''
+    display_duration: str = ''
+
+# 지역 목록: (표시 이름, 국가 코드, 한국어 이름)
+REGIONS = [
+    ('🇰🇷 대한민국', 'KR', '대한민국'),
+    ('🇺🇸 미국', 'US', '미국'),
+    ('🇯🇵 일본', 'JP', '일본'),
+    ('🇬🇧 영국', 'GB', '영국'),
+    ('🇨🇦 캐나다', 'CA', '캐나다'),
+    ('🇦🇺 호주', 'AU', '호주'),
+    ('🇩🇪 독일', 'DE', '독일'),
+    ('🇫🇷 프랑스', 'FR', '프랑스'),
+    ('🇮🇳 인도', 'IN', '인도'),
+    ('🇧🇷 브라질', 'BR', '브라질')
+]
+
+# 표시 이름을 (국가 코드, 한국어 이름)으로 변환
+REGION_BY_LABEL = {label: (code, name) for label, code, name in REGIONS}
+
+# 지역 선택 목록
+REGION_LABELS = [label for label, _, _ in REGIONS]
 
 # 국가 코드를 한국어 이름으로 변환
-CODE_TO_NAME = {v: k.split(' ')[1] for k, v in REGION_CODES.items()}
+CODE_TO_NAME = {code: name for _, code, name in REGIONS}
+
+def _connect_channel_cache() -> sqlite3.Connection:
+    """Open the on-disk channel cache, creating it if needed."""
+    os.makedirs(os.path.dirname(CHANNEL_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(CHANNEL_CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS channels (id TEXT PRIMARY KEY, json BLOB, ts INTEGER)"
+    )
+    return conn
+
+def _load_cached_channels(channel_ids: List[str]) -> Dict[str, Dict]:
+    """Return channel information cached on disk that has not expired yet."""
+    if not channel_ids:
+        return {}
+    try:
+        conn = _connect_channel_cache()
+        try:
+            placeholders = ','.join('?' * len(channel_ids))
+            rows = conn.execute(
+                f"SELECT id, json FROM channels WHERE ts >= ? AND id IN ({placeholders})",
+                [int(time.time()) - CHANNEL_CACHE_TTL, *channel_ids]
+            ).fetchall()
+        finally:
+            conn.close()
+        return {channel_id: orjson.loads(data) for channel_id, data in rows}
+    except (sqlite3.Error, OSError, orjson.JSONDecodeError):
+        return {}
+
+def _store_cached_channels(channels: Dict[str, Dict]) -> None:
+    """Save channel information to the on-disk cache."""
+    if not channels:
+        return
+    try:
+        conn = _connect_channel_cache()
+        try:
+            now = int(time.time())
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO channels (id, json, ts) VALUES (?, ?, ?)",
+                    [(channel_id, orjson.dumps(info), now) for channel_id, info in channels.items()]
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        pass
 
-def get_channel_info(api_key: str, channel_id: str) -> Dict:
-    """Fetch channel information including subscriber count."""
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_channel_info(_api_key: str, channel_id: str) -> Dict:
+    """Fetch channel information including subscriber count.
+
+    Raises on failure so that failed lookups are not cached.
+    """
     url = "https://www.googleapis.com/youtube/v3/channels"
     params = {
         'part': 'statistics,snippet',
         'id': channel_id,
-        'key': api_key
+        'key': _api_key
     }
     
+    response = _session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    if 'items' in data and data['items']:
+        item = data['items'][0]
+        return {
+            'statistics': item.get('statistics', {}),
+            'snippet': item.get('snippet', {})
+        }
+    return {'statistics': {}, 'snippet': {}}
+
+def _try_channel_info(api_key: str, channel_id: str) -> Optional[Dict]:
+    """Return channel information from the Data API, or None if the request failed."""
+    try:
+        return get_channel_info(api_key, channel_id)
+    except Exception:
+        return None
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def get_channel_info_ytdlp(channel_id: str) -> Dict:
+    """Fetch channel subscriber count and thumbnail with yt-dlp (no API quota).
+
+    Raises on failure so that failed lookups are not cached.
+    """
+    with yt_dlp.YoutubeDL({'quiet': True, 'extract_flat': True, 'skip_download': True}) as ydl:
+        info = ydl.extract_info(f"https://www.youtube.com/channel/{channel_id}", download=False)
+    
+    subscribers = info.get('channel_follower_count')
+    if subscribers is None:
+        raise ValueError(f"No follower count for channel {channel_id}")
+    
+    # 채널 아바타 썸네일을 우선 사용
+    thumbnails = info.get('thumbnails') or []
+    thumbnail_url = next(
+        (t['url'] for t in thumbnails if t.get('id') == 'avatar_uncropped'),
+        thumbnails[-1]['url'] if thumbnails else ''
+    )
+    
+    return {
+        'statistics': {'subscriberCount': str(subscribers)},
+        'snippet': {'thumbnails': {'default': {'url': thumbnail_url}}}
+    }
+
+def _try_channel_info_ytdlp(channel_id: str) -> Optional[Dict]:
+    """Return channel information from yt-dlp, or None if the lookup failed."""
     try:
-        response = requests.get(url, params=params)
+        return get_channel_info_ytdlp(channel_id)
+    except Exception:
+        return None
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_channels_info(_api_key: str, channel_ids: List[str]) -> Dict[str, Dict]:
+    """Fetch channel information for many channels in batched requests.
+
+    Raises on failure so that failed lookups are not cached.
+    """
+    url = "https://www.googleapis.com/youtube/v3/channels"
+    channel_cache = {}
+    
+    # channels.list는 한 번에 최대 50개의 ID를 받음
+    for i in range(0, len(channel_ids), 50):
+        chunk = channel_ids[i:i + 50]
+        params = {
+            'part': 'statistics,snippet',
+            'id': ','.join(chunk),
+            'key': _api_key
+        }
+        
+        response = _session.get(url, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
-        if 'items' in data and data['items']:
-            item = data['items'][0]
-            return {
+        for item in data.get('items', []):
+            channel_cache[item['id']] = {
                 'statistics': item.get('statistics', {}),
                 'snippet': item.get('snippet', {})
             }
-        return {'statistics': {}, 'snippet': {}}
-    except Exception as e:
-        st.error(f"채널 정보를 가져오는 중 오류 발생: {e}")
-        return {'statistics': {}, 'snippet': {}}
+    
+    return channel_cache
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_popular_videos(_api_key: str, region_code: str = 'KR', max_results: int = 30) -> List[Dict]:
+    """Fetch popular videos from YouTube using direct API calls.
 
-def get_popular_videos(api_key: str, region_code: str = 'KR', max_results: int = 30) -> List[Dict]:
-    """Fetch popular videos from YouTube using direct API calls."""
+    Returns plain dicts (fields of Video) so the cached result stays picklable
+    across reruns, which redefine the Video class.
+
+    Raises on failure so that failed lookups are not cached.
+    """
     base_url = "https://www.googleapis.com/youtube/v3/videos"
     
     # Get popular videos with additional statistics
@@ -68,49 +298,88 @@ def get_popular_videos(api_key: str, region_code: str = 'KR', max_results: int =
         'chart': 'mostPopular',
         'regionCode': region_code,
         'maxResults': max_results,
-        'key': api_key
+        'key': _api_key
     }
     
-    try:
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
-        data = response.json()
+    response = _session.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    items = data.get('items', [])
+    
+    channel_ids = list({item['snippet']['channelId'] for item in items})
+    
+    # 디스크에 캐시된 채널 정보를 먼저 사용
+    channel_cache = _load_cached_channels(channel_ids)
+    fetch_ids = [cid for cid in channel_ids if cid not in channel_cache]
+    
+    # 채널 정보는 API 할당량을 쓰지 않는 yt-dlp로 먼저 가져오기
+    if yt_dlp is not None and fetch_ids:
+        with ThreadPoolExecutor(max_workers=MAX_CHANNEL_WORKERS) as executor:
+            results = executor.map(_try_channel_info_ytdlp, fetch_ids)
+            channel_cache.update(
+                (cid, info) for cid, info in zip(fetch_ids, results) if info is not None
+            )
+    
+    # yt-dlp로 가져오지 못한 채널은 API로 한 번에 가져오기 (최대 50개씩 묶어서 요청)
+    missing_ids = [cid for cid in channel_ids if cid not in channel_cache]
+    batch_failed = False
+    if missing_ids:
+        try:
+            channel_cache.update(get_channels_info(_api_key, missing_ids))
+        except Exception:
+            batch_failed = True  # 아래의 개별 요청으로 보충
+    
+    # 일괄 요청이 실패했을 때만 개별 요청을 병렬로 보내서 보충
+    # (일괄 요청이 성공했는데 빠진 채널은 존재하지 않거나 비공개라서 다시 요청해도 비어 있음)
+    if batch_failed:
+        with ThreadPoolExecutor(max_workers=MAX_CHANNEL_WORKERS) as executor:
+            results = executor.map(lambda cid: _try_channel_info(_api_key, cid), missing_ids)
+            channel_cache.update(
+                (cid, info) for cid, info in zip(missing_ids, results) if info is not None
+            )
+    
+    # 새로 가져온 채널 정보 중 유효한 것만 디스크에 저장
+    _store_cached_channels({
+        cid: channel_cache[cid] for cid in fetch_ids
+        if channel_cache.get(cid, {}).get('statistics')
+    })
+    
+    videos = []
+    for item in items:
+        snippet = item['snippet']
+        stats = item.get('statistics', {})
+        channel_id = snippet['channelId']
         
-        videos = []
-        channel_cache = {}  # 채널 정보 캐시
+        channel_data = channel_cache.get(channel_id, {})
+        channel_stats = channel_data.get('statistics', {})
+        channel_snippet = channel_data.get('snippet', {})
         
-        for item in data.get('items', []):
-            video_id = item['id']
-            channel_id = item['snippet']['channelId']
-            
-            # 채널 정보 가져오기 (캐시에 없을 경우에만 API 호출)
-            if channel_id not in channel_cache:
-                channel_cache[channel_id] = get_channel_info(api_key, channel_id)
-            
-            channel_data = channel_cache[channel_id]
-            channel_stats = channel_data.get('statistics', {})
-            channel_snippet = channel_data.get('snippet', {})
-            
-            video = {
-                'id': video_id,
-                'title': item['snippet']['title'],
-                'channel': item['snippet']['channelTitle'],
-                'channel_id': channel_id,
-                'thumbnail': item['snippet']['thumbnails']['medium']['url'],
-                'views': int(item['statistics'].get('viewCount', 0)),
-                'likes': int(item['statistics'].get('likeCount', 0)),
-                'comments': int(item['statistics'].get('commentCount', 0)),
-                'subscribers': int(channel_stats.get('subscriberCount', 0)) if channel_stats else 0,
-                'published_at': item['snippet']['publishedAt'],
-                'duration': item['contentDetails'].get('duration', 'PT0S'),
-                'channel_thumbnail': channel_snippet.get('thumbnails', {}).get('default', {}).get('url', '')
-            }
-            videos.append(video)
-            
-        return videos
-    except Exception as e:
-        st.error(f"YouTube API 오류가 발생했습니다: {e}")
-        return []
+        views = int(stats.get('viewCount', '0'))
+        duration = item.get('contentDetails', {}).get('duration', 'PT0S')
+        
+        # 표시용 문자열은 가져올 때 한 번만 계산 (게시 시간은 화면에 그릴 때 계산)
+        videos.append({
+            'id': item['id'],
+            'title': snippet['title'],
+            'channel': snippet['channelTitle'],
+            'channel_id': channel_id,
+            'thumbnail': snippet['thumbnails']['medium']['url'],
+            'views': views,
+            'likes': int(stats.get('likeCount', '0')),
+            'comments': int(stats.get('commentCount', '0')),
+            'subscribers': int(channel_stats.get('subscriberCount', '0')),
+            'published_at': snippet['publishedAt'],
+            'duration': duration,
+            'channel_thumbnail': channel_snippet.get('thumbnails', {}).get('default', {}).get('url', ''),
+            'display_views': format_count(views),
+            'display_duration': format_duration(duration)
+        })
+        
+    return videos
+
+# ISO 8601 재생시간 (예: PT1H2M3S, P1DT2H3M)
+DURATION_PATTERN = re.compile(r'P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
 
 def format_count(count: int) -> str:
     """Format large numbers to a more readable format."""
@@ -123,20 +392,22 @@ def format_count(count: int) -> str:
 def format_duration(duration: str) -> str:
     """Convert ISO 8601 duration to human-readable format."""
     
-    # Extract hours, minutes, and seconds using regex
-    hours = int(re.search(r'(\d+)H', duration)[1]) if 'H' in duration else 0
-    minutes = int(re.search(r'(\d+)M', duration)[1]) if 'M' in duration else 0
-    seconds = int(re.search(r'(\d+)S', duration)[1]) if 'S' in duration else 0
+    # Extract days, hours, minutes, and seconds in a single regex match
+    match = DURATION_PATTERN.match(duration)
+    days, hours, minutes, seconds = (int(x) if x else 0 for x in match.groups()) if match else (0, 0, 0, 0)
+    hours += days * 24
     
     # Format as HH:MM:SS or MM:SS
     if hours > 0:
         return f"{hours}:{minutes:02d}:{seconds:02d}"
     return f"{minutes}:{seconds:02d}"
 
-def format_published_date(published_at):
+def format_published_date(published_at: str, now: Optional[datetime] = None) -> str:
     """Format published date to a relative time string."""
-    published = datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%SZ')
-    now = datetime.utcnow()
+    # YouTube API는 항상 'YYYY-MM-DDTHH:MM:SSZ' 형식을 반환하므로 끝의 'Z'만 제거
+    published = datetime.fromisoformat(published_at[:-1])
+    if now is None:
+        now = datetime.utcnow()
     delta = now - published
     
     if delta.days > 365:
@@ -156,23 +427,38 @@ def format_published_date(published_at):
     else:
         return "방금 전"
 
-def main():
-    st.title("YouTube 인기 동영상 🎬")
+def _render_video_card(video: Video, now: datetime) -> str:
+    """Build the HTML for a single video card."""
+    esc = html.escape
     
-    # 사이드바 설정
-    st.sidebar.title("설정")
+    # 채널 정보
+    channel_thumbnail_html = ''
+    if video.channel_thumbnail:
+        channel_thumbnail_html = f'<img class="channel-thumbnail" src="{esc(video.channel_thumbnail)}"/>'
     
-    # Get API key from environment or secrets
+    return (
+        '<div class="video-card">'
+        f'<img class="video-thumbnail" src="{esc(video.thumbnail)}"/>'
+        f'<p class="video-title"><strong>{esc(video.title)}</strong></p>'
+        f'<div class="video-channel">{channel_thumbnail_html}<span>{esc(video.channel)}</span></div>'
+        f'<p>👁️ {video.display_views}회 • ⏳ {format_published_date(video.published_at, now)}</p>'
+        f'<p>⏱️ {video.display_duration}</p>'
+        '</div>'
+    )
+
+@st.cache_resource
+def _get_api_key() -> Tuple[Optional[str], List[Tuple[str, str]]]:
+    """Find the YouTube API key and return it with sidebar messages (level, text)."""
     api_key = None
+    messages = []
     
     # Method 1: Try to get from environment variables
     try:
-        import os
         api_key = os.getenv('YOUTUBE_API_KEY')
         if api_key:
-            st.sidebar.success("API key loaded from environment variables")
+            messages.append(('success', "API key loaded from environment variables"))
     except Exception as e:
-        st.sidebar.warning(f"Environment variable error: {str(e)}")
+        messages.append(('warning', f"Environment variable error: {str(e)}"))
     
     # Method 2: Try to get from secrets.toml
     if not api_key:
@@ -181,24 +467,34 @@ def main():
             if hasattr(st, 'secrets') and 'secrets' in st:
                 api_key = st['secrets'].get('YOUTUBE_API_KEY')
                 if api_key:
-                    st.sidebar.success("API key loaded from secrets.toml")
+                    messages.append(('success', "API key loaded from secrets.toml"))
         except Exception as e:
-            st.sidebar.warning("Could not load API key from secrets.toml")
+            messages.append(('warning', "Could not load API key from secrets.toml"))
     
     # Method 3: Try direct file read as last resort
-    if not api_key:
+    if not api_key and toml is not None:
         try:
-            import os
-            secrets_path = os.path.join(os.path.dirname(__file__), '.streamlit', 'secrets.toml')
-            if os.path.exists(secrets_path):
-                import toml
-                with open(secrets_path, 'r') as f:
-                    secrets = toml.load(f)
+            if os.path.exists(SECRETS_PATH):
+                with open(SECRETS_PATH, 'r') as f:
+                    secrets = toml.loads(f.read())
                     api_key = secrets.get('secrets', {}).get('YOUTUBE_API_KEY')
                     if api_key:
-                        st.sidebar.success("API key loaded from file")
+                        messages.append(('success', "API key loaded from file"))
         except Exception as e:
-            st.sidebar.warning("Could not load API key from file")
+            messages.append(('warning', "Could not load API key from file"))
+    
+    return api_key, messages
+
+def main():
+    st.title("YouTube 인기 동영상 🎬")
+    
+    # 사이드바 설정
+    st.sidebar.title("설정")
+    
+    # Get API key from environment or secrets
+    api_key, messages = _get_api_key()
+    for level, message in messages:
+        getattr(st.sidebar, level)(message)
     
     if not api_key:
         st.error("""
@@ -221,16 +517,17 @@ def main():
            
         [YouTube Data API](https://console.cloud.google.com/apis/library/youtube.googleapis.com)에서 API 키를 발급받을 수 있습니다.
         """)
+        # 키를 찾지 못한 결과는 캐시하지 않고 다음 실행에서 다시 찾기
+        _get_api_key.clear()
         return
     
     # 지역 선택
     selected_region_key = st.sidebar.selectbox(
         '지역 선택:',
-        list(REGION_CODES.keys()),
+        REGION_LABELS,
         index=0  # 기본값으로 대한민국 선택
     )
-    region_code = REGION_CODES[selected_region_key]
-    region_name = selected_region_key.split(' ')[1]  # 이모지 제거하고 한국어 이름만 추출
+    region_code, region_name = REGION_BY_LABEL[selected_region_key]
     
     # 결과 수 선택
     max_results = st.sidebar.slider("표시할 동영상 수:", 10, 50, 30, 10)
@@ -238,61 +535,40 @@ def main():
     st.markdown(f"### {region_name}에서 인기 있는 동영상 {max_results}개")
     
     # Add refresh button
+    # 동영상과 API 채널 정보 캐시만 비우기
+    # (yt-dlp·디스크 채널 캐시는 모든 세션이 공유하므로 유지하고 24시간 TTL로 갱신)
     if st.sidebar.button("새로고침 🔄"):
-        st.experimental_rerun()
+        get_popular_videos.clear()
+        get_channels_info.clear()
+        get_channel_info.clear()
     
     # Load videos
-    with st.spinner(f'{region_name}의 인기 동영상을 불러오는 중...'):
-        videos = get_popular_videos(api_key, region_code, max_results)
+    try:
+        with st.spinner(f'{region_name}의 인기 동영상을 불러오는 중...'):
+            videos = [Video(**video) for video in get_popular_videos(api_key, region_code, max_results)]
+    except Exception as e:
+        st.error(f"YouTube API 오류가 발생했습니다: {e}")
+        st.warning("동영상을 불러오는 데 실패했습니다. API 키를 확인해주세요.")
+        return
     
     if not videos:
-        st.warning("동영상을 불러오는 데 실패했습니다. API 키를 확인해주세요.")
+        st.warning("표시할 인기 동영상이 없습니다.")
         return
         
     # 조회수(view_count) 기준으로 내림차순 정렬
-    videos.sort(key=lambda x: x.get('views', 0), reverse=True)
+    views = np.fromiter((v.views for v in videos), dtype=np.int64, count=len(videos))
+    order = np.argsort(-views, kind='stable')
+    videos = [videos[i] for i in order]
     
-    # Display videos in a grid
-    cols = 3
-    rows = (len(videos) + cols - 1) // cols
+    # 모든 동영상이 같은 기준 시각을 사용하도록 한 번만 조회
+    now = datetime.utcnow()
     
-    for i in range(rows):
-        row_videos = videos[i*cols:(i+1)*cols]
-        cols_list = st.columns(cols)
-        
-        for idx, video in enumerate(row_videos):
-            with cols_list[idx]:
-                # 썸네일과 재생시간
-                st.image(
-                    video['thumbnail'],
-                    use_container_width=True
-                )
-                
-                # 제목
-                st.markdown(f"**{video['title']}**")
-                
-                # 동영상 설명 (1줄 요약)
-                if 'description' in video and video['description']:
-                    # 설명이 긴 경우 50자로 제한하고 말줄임표 추가
-                    description = video['description'].strip()
-                    if len(description) > 50:
-                        description = description[:47] + '...'
-                    st.caption(description, help=video['description'])
-                
-                # 채널 정보
-                col1, col2 = st.columns([1, 5])
-                with col1:
-                    if video['channel_thumbnail']:
-                        st.image(video['channel_thumbnail'], width=30)
-                with col2:
-                    st.markdown(f"{video['channel']}")
-                
-                # 통계 정보
-                st.markdown(f"👁️ {format_count(video['views'])}회 • ⏳ {format_published_date(video['published_at'])}")
-                st.markdown(f"⏱️ {format_duration(video['duration'])}")
-                
-                # 구분선
-                st.markdown("---")
+    # Display videos in a grid (한 번의 st.markdown 호출로 전체 그리드 렌더링)
+    cards = ''.join(_render_video_card(video, now) for video in videos)
+    st.markdown(
+        f'{VIDEO_GRID_STYLE}<div class="video-grid">{cards}</div>',
+        unsafe_allow_html=True
+    )
 
 if __name__ == "__main__":
     main()